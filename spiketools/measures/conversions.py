@@ -86,6 +86,63 @@ def convert_train_to_times(spike_train, fs=1000, start_time=0):
     return spikes
 
 
+def convert_train_to_packed(spike_train):
+    """Convert a binary spike train into a bit-packed representation.
+
+    Parameters
+    ----------
+    spike_train : 1d array
+        Spike train.
+
+    Returns
+    -------
+    packed_train : 1d array of uint8
+        Bit-packed spike train, with each element storing 8 samples of the spike train.
+
+    Notes
+    -----
+    The packed representation uses 1 bit per sample, which can be useful for storing long
+    spike trains. To convert back, use `convert_packed_to_train`, passing in the number of samples.
+
+    Examples
+    --------
+    Convert a spike train into a bit-packed representation:
+
+    >>> spike_train = np.array([0, 0, 1, 0, 1, 0, 0, 0, 0, 1])
+    >>> convert_train_to_packed(spike_train)
+    array([40, 64], dtype=uint8)
+    """
+
+    return np.packbits(spike_train.astype(bool))
+
+
+def convert_packed_to_train(packed_train, n_samples):
+    """Convert a bit-packed spike train back into a binary spike train.
+
+    Parameters
+    ----------
+    packed_train : 1d array of uint8
+        Bit-packed spike train.
+    n_samples : int
+        The number of samples in the original spike train.
+
+    Returns
+    -------
+    spike_train : 1d array
+        Spike train.
+
+    Examples
+    --------
+    Convert a bit-packed spike train back into a binary spike train:
+
+    >>> packed_train = np.array([40, 64], dtype=np.uint8)
+    >>> convert_packed_to_train(packed_train, n_samples=10)
+    array([0, 0, 1, 0, 1, 0, 0, 0, 0, 1])
+    """
+
+    return np.unpackbits(packed_train, count=n_samples).astype(int)
+
+
 def convert_isis_to_times(isis, add_initial=True, start_time=0):
     """Convert a sequence of inter-spike intervals to spike times.
 
@@ -150,7 +207,12 @@ def convert_times_to_counts(spikes, bins, time_range=None):
     """
 
     bins = check_time_bins(bins, time_range, spikes)
-    spike_bin_counts, _ = np.histogram(spikes, bins)
+
+    bin_widths = np.diff(bins)
+    if len(bins) > 2 and np.all(np.abs(bin_widths - bin_widths[0]) <= 1e-9 * bin_widths[0]):
+        spike_bin_counts = _compute_uniform_bin_counts(spikes, bins)
+    else:
+        spike_bin_counts, _ = np.histogram(spikes, bins)
 
     return spike_bin_counts
 
@@ -195,3 +257,40 @@ def convert_times_to_rates(spikes, bins, time_range=None, smooth=None):
         cfr = smooth_data(cfr, smooth)
 
     return cfr
+
+
+def _compute_uniform_bin_counts(spikes, bins):
+    """Compute counts of spikes per time bin, for uniformly spaced time bins.
+
+    Parameters
+    ----------
+    spikes : 1d array
+        Spike times, in seconds.
+    bins : 1d array
+        Time bin definitions, which should be uniformly spaced.
+
+    Returns
+    -------
+    spike_bin_counts : 1d array
+        Vector of counts of the number of spikes per time bin.
+
+    Notes
+    -----
+    For uniform bins, the bin index of each spike can be computed directly from its time,
+    which avoids the sorting & searching used by `np.histogram` for arbitrary bin definitions.
+    Bin assignments are checked against the given bin edges, so the output matches `np.histogram`,
+    including the last bin being inclusive of the right-most edge.
+    """
+
+    n_bins = len(bins) - 1
+    spikes = spikes[(spikes >= bins[0]) & (spikes <= bins[-1])]
+
+    inds = np.clip(((spikes - bins[0]) / (bins[1] - bins[0])).astype(int), 0, n_bins - 1)
+
+    # Correct for any floating point rounding in the computed indices, relative to the bin edges
+    inds[spikes < bins[inds]] -= 1
+    inds[(spikes >= bins[inds + 1]) & (inds < n_bins - 1)] += 1
+
+    spike_bin_counts = np.bincount(inds, minlength=n_bins)
+
+    return spike_bin_counts
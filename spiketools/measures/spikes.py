@@ -118,6 +118,41 @@ def compute_fano_factor(spike_train):
     return np.var(spike_train) / np.mean(spike_train)
 
 
+def compute_packed_spike_count(packed_train):
+    """Compute the number of spikes in a bit-packed spike train.
+
+    Parameters
+    ----------
+    packed_train : 1d array of uint8
+        Bit-packed spike train, as returned by `convert_train_to_packed`.
+
+    Returns
+    -------
+    count : int
+        The number of spikes in the spike train.
+
+    Notes
+    -----
+    This counts set bits directly on the packed representation, which avoids unpacking the
+    spike train. If available (numpy >= 2.0), this uses `np.bitwise_count` (popcount).
+
+    Examples
+    --------
+    Compute the number of spikes in a bit-packed spike train:
+
+    >>> packed_train = np.array([40, 64], dtype=np.uint8)
+    >>> compute_packed_spike_count(packed_train)
+    3
+    """
+
+    if hasattr(np, 'bitwise_count'):
+        count = int(np.bitwise_count(packed_train).sum())
+    else:
+        count = int(np.unpackbits(packed_train).sum())
+
+    return count
+
+
 def compute_spike_presence(spikes, bins, time_range=None):
     """Compute the spike presence across time bins.
 
@@ -1,13 +1,14 @@
 """Functions to compute trial-related measures."""
 
 import numpy as np
+from scipy.signal import fftconvolve
 
-from spiketools.utils.extract import get_range
+from spiketools.utils.data import smooth_data
+from spiketools.utils.extract import get_range, create_mask
 from spiketools.utils.options import get_avg_func
 from spiketools.utils.checks import check_time_bins
 from spiketools.utils.timestamps import create_bin_times
-from spiketools.measures.spikes import compute_firing_rate
-from spiketools.measures.conversions import convert_times_to_rates
+from spiketools.objects.trials import TrialSpikes
 
 ###################################################################################################
 ###################################################################################################
@@ -17,7 +18,7 @@ def compute_trial_frs(trial_spikes, bins, time_range=None, smooth=None):
 
     Parameters
     ----------
-    trial_spikes : list of 1d array
+    trial_spikes : list of 1d array or TrialSpikes
         Spike times per trial, in seconds.
     bins : float or 1d array
         The binning to apply to the spiking data.
@@ -55,9 +56,18 @@ def compute_trial_frs(trial_spikes, bins, time_range=None, smooth=None):
     bins = check_time_bins(bins, time_range)
     bin_times = create_bin_times(bins)
 
-    trial_cfrs = np.zeros([len(trial_spikes), len(bin_times)])
-    for ind, t_spikes in enumerate(trial_spikes):
-        trial_cfrs[ind, :] = convert_times_to_rates(t_spikes, bins, smooth)
+    # Bin all trials together, using the trial index of each spike as the first dimension
+    trial_inds, all_spikes = _concatenate_trials(trial_spikes)
+    trial_counts, _, _ = np.histogram2d(trial_inds, all_spikes,
+                                        bins=[np.arange(len(trial_spikes) + 1), bins])
+    trial_cfrs = trial_counts / np.diff(bins)
+
+    if smooth:
+        # For long recordings with wide smoothing kernels, smoothing is faster in the frequency domain
+        if trial_cfrs.shape[1] > 1024 and smooth > 10:
+            trial_cfrs = _smooth_trials_fft(trial_cfrs, smooth)
+        else:
+            trial_cfrs = smooth_data(trial_cfrs, smooth, axis=1)
 
     return bin_times, trial_cfrs
 
@@ -67,7 +77,7 @@ def compute_pre_post_rates(trial_spikes, pre_window, post_window):
 
     Parameters
     ----------
-    trial_spikes : list of 1d array
+    trial_spikes : list of 1d array or TrialSpikes
         Spike times per trial.
     pre_window, post_window : list of [float, float]
         The pre and post event time window, in seconds, to compute firing rate across.
@@ -89,8 +99,13 @@ def compute_pre_post_rates(trial_spikes, pre_window, post_window):
     (array([6., 2., 0.]), array([2.5, 2.5, 7.5]))
     """
 
-    frs_pre = np.array([compute_firing_rate(trial, pre_window) for trial in trial_spikes])
-    frs_post = np.array([compute_firing_rate(trial, post_window) for trial in trial_spikes])
+    n_trials = len(trial_spikes)
+    trial_inds, all_spikes = _concatenate_trials(trial_spikes)
+
+    frs_pre = np.bincount(trial_inds[create_mask(all_spikes, *pre_window)],
+                          minlength=n_trials) / (pre_window[1] - pre_window[0])
+    frs_post = np.bincount(trial_inds[create_mask(all_spikes, *post_window)],
+                           minlength=n_trials) / (post_window[1] - post_window[0])
 
     return frs_pre, frs_post
 
@@ -100,8 +115,8 @@ def compute_segment_frs(spikes, segments):
 
     Parameters
     ----------
-    spikes : 1d array or list of 1d array
-        Spike times, in seconds. Can be single array, or list of spike times per trial.
+    spikes : 1d array or list of 1d array or TrialSpikes
+        Spike times, in seconds. Can be single array, or spike times per trial.
     segments : 2d array
         Time definitions of the segments, per trial, used as time bins.
         Should have shape: [n_trials, n_segments + 1].
@@ -127,12 +142,23 @@ def compute_segment_frs(spikes, segments):
            [10.,  5.]])
     """
 
-    if not isinstance(spikes, list):
+    if isinstance(spikes, np.ndarray):
         spikes = [get_range(spikes, segment[0], segment[-1]) for segment in segments]
 
-    frs = np.zeros([segments.shape[0], segments.shape[1] - 1])
-    for ind, (t_spikes, segment) in enumerate(zip(spikes, segments)):
-        frs[ind, :] = convert_times_to_rates(t_spikes, segment)
+    n_trials, n_segments = segments.shape[0], segments.shape[1] - 1
+    trial_inds, all_spikes = _concatenate_trials(spikes)
+
+    # Assign each spike to a segment, based on the segment definitions for its trial
+    #   Spikes equal to the final segment edge are included in the last segment
+    seg_inds = np.concatenate([np.zeros(0, dtype=int)] +
+        [np.searchsorted(segment, trial, side='right') - 1
+            for trial, segment in zip(spikes, segments)])
+    seg_inds[all_spikes == segments[trial_inds, -1]] = n_segments - 1
+    valid = (seg_inds >= 0) & (seg_inds < n_segments)
+
+    counts = np.bincount(trial_inds[valid] * n_segments + seg_inds[valid],
+                         minlength=n_trials * n_segments)
+    frs = counts.reshape(n_trials, n_segments) / np.diff(segments, axis=1)
 
     return frs
 
@@ -203,3 +229,63 @@ def compute_pre_post_diffs(frs_pre, frs_post, average=True, avg_type='mean'):
         diffs = get_avg_func(avg_type)(diffs)
 
     return diffs
+
+
+def _concatenate_trials(trial_spikes):
+    """Concatenate spike times across trials, labelling each spike by trial.
+
+    Parameters
+    ----------
+    trial_spikes : list of 1d array or TrialSpikes
+        Spike times per trial.
+
+    Returns
+    -------
+    trial_inds : 1d array
+        The index of the trial that each spike comes from.
+    all_spikes : 1d array
+        Spike times, concatenated across all trials.
+    """
+
+    if isinstance(trial_spikes, TrialSpikes):
+        return trial_spikes.trial_inds, trial_spikes.spikes
+
+    trial_inds = np.repeat(np.arange(len(trial_spikes)), [len(trial) for trial in trial_spikes])
+    all_spikes = np.concatenate(trial_spikes) if len(trial_spikes) else np.array([])
+
+    return trial_inds, all_spikes
+
+
+def _smooth_trials_fft(trial_cfrs, sigma):
+    """Smooth firing rates per trial with a gaussian kernel, using FFT-based convolution.
+
+    Parameters
+    ----------
+    trial_cfrs : 2d array
+        Continuous firing rates per trial, with shape [n_trials, n_time_bins].
+    sigma : float
+        Standard deviation of the gaussian kernel to apply for smoothing, in bins.
+
+    Returns
+    -------
+    trial_cfrs : 2d array
+        The smoothed firing rates per trial.
+
+    Notes
+    -----
+    This matches smoothing with `smooth_data` along the time axis (same kernel, and reflected
+    edges), up to floating point round-off, but the cost does not scale with the kernel length,
+    which is faster for wide kernels.
+    """
+
+    radius = int(4 * sigma + 0.5)
+    kernel = np.exp(-0.5 * (np.arange(-radius, radius + 1) / sigma) ** 2)
+    kernel = kernel / np.sum(kernel)
+
+    padded = np.pad(trial_cfrs, ((0, 0), (radius, radius)), mode='symmetric')
+    trial_cfrs = fftconvolve(padded, kernel[np.newaxis, :], mode='valid', axes=1)
+
+    # Clip round-off error from the FFT, which can give small negative values where rates are zero
+    np.maximum(trial_cfrs, 0, out=trial_cfrs)
+
+    return trial_cfrs
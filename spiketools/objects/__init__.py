@@ -2,3 +2,4 @@
 
 from .unit import Unit
 from .session import Session
+from .trials import TrialSpikes
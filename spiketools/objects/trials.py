@@ -0,0 +1,113 @@
+"""Trial spikes object."""
+
+import numpy as np
+
+###################################################################################################
+###################################################################################################
+
+class TrialSpikes():
+    """A TrialSpikes object, storing spike times across trials in a single array.
+
+    Parameters
+    ----------
+    spikes : 1d array
+        Spike times, in seconds, concatenated across all trials.
+    offsets : 1d array of int
+        Start index of each trial in `spikes`, with a final entry for the end of the last trial.
+        Should have length n_trials + 1, such that trial `i` is `spikes[offsets[i]:offsets[i+1]]`.
+
+    Notes
+    -----
+    Storing spike times in one contiguous array, rather than as a list of arrays, allows for
+    computing measures across all trials at once. Indexing an individual trial returns a view.
+    Indexing with a slice returns a new TrialSpikes object, with a copy of the selected trials.
+
+    Examples
+    --------
+    Create a TrialSpikes object from a list of spike times per trial:
+
+    >>> trial_spikes = TrialSpikes.from_list([np.array([0.1, 0.2]), np.array([0.15])])
+    >>> trial_spikes[1]
+    array([0.15])
+    """
+
+    def __init__(self, spikes=None, offsets=None):
+        """Initialize TrialSpikes object."""
+
+        self.spikes = np.array([]) if spikes is None else np.asarray(spikes)
+        self.offsets = np.array([0]) if offsets is None else np.asarray(offsets, dtype=np.int64)
+
+        if self.offsets.ndim != 1 or len(self.offsets) == 0 or self.offsets[0] != 0 or \
+            self.offsets[-1] != len(self.spikes) or np.any(np.diff(self.offsets) < 0):
+            msg = ("Offsets should be a non-decreasing 1d array, starting at 0 "
+                   "and ending at the number of spikes.")
+            raise ValueError(msg)
+
+
+    def __len__(self):
+
+        return len(self.offsets) - 1
+
+
+    def __getitem__(self, ind):
+
+        if isinstance(ind, slice):
+            return TrialSpikes.from_list([self[tind] for tind in range(len(self))[ind]])
+
+        ind = range(len(self))[ind]
+
+        return self.spikes[self.offsets[ind]:self.offsets[ind + 1]]
+
+
+    def __iter__(self):
+
+        for ind in range(len(self)):
+            yield self[ind]
+
+
+    @classmethod
+    def from_list(cls, trial_spikes):
+        """Create a TrialSpikes object from a list of spike times per trial.
+
+        Parameters
+        ----------
+        trial_spikes : list of 1d array
+            Spike times per trial, in seconds.
+
+        Returns
+        -------
+        TrialSpikes
+            Object with the spike times across all trials.
+        """
+
+        offsets = np.zeros(len(trial_spikes) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(trial) for trial in trial_spikes])
+        spikes = np.concatenate(trial_spikes) if len(trial_spikes) else np.array([])
+
+        return cls(spikes, offsets)
+
+
+    def to_list(self):
+        """Convert to a list of spike times per trial.
+
+        Returns
+        -------
+        list of 1d array
+            Spike times per trial, in seconds.
+        """
+
+        return [self[ind] for ind in range(len(self))]
+
+
+    @property
+    def n_trials(self):
+        """The number of trials contained in the object."""
+
+        return len(self)
+
+
+    @property
+    def trial_inds(self):
+        """The index of the trial that each spike comes from."""
+
+        return np.repeat(np.arange(len(self)), np.diff(self.offsets))
@@ -2,8 +2,8 @@
 
 import numpy as np
 
-from spiketools.stats.generators import poisson_generator
 from spiketools.sim.utils import apply_refractory
+from spiketools.utils.random import check_rng
 from spiketools.utils.checks import check_param_options
 
 ###################################################################################################
@@ -49,7 +49,7 @@ def sim_spiketimes(spike_param, duration, method, refractory=0.001, **kwargs):
 ## Distribution based simulations
 
 @apply_refractory('times')
-def sim_spiketimes_poisson(rate, duration, start_time=0, refractory=0.001):
+def sim_spiketimes_poisson(rate, duration, start_time=0, rng=None, refractory=0.001):
     """Simulate spike times based on a Poisson distribution.
 
     Parameters
@@ -60,6 +60,10 @@ def sim_spiketimes_poisson(rate, duration, start_time=0, refractory=0.001):
         Duration of spike times to simulate, in seconds.
     start_time: float, optional
         Timestamp of the start time for the simulated spike times.
+    rng : np.random.Generator or np.random.RandomState or int, optional
+        Random number generator, or seed, to use for the simulation.
+        If not provided, the global numpy random state is used.
+        Should be passed by keyword, as it precedes `refractory` in the function signature.
     refractory : float, optional, default: 0.001
         The refractory period to apply to the simulated data, in seconds.
 
@@ -75,7 +79,22 @@ def sim_spiketimes_poisson(rate, duration, start_time=0, refractory=0.001):
     >>> spike_times = sim_spiketimes_poisson(10, 5, start_time=2)
     """
 
-    spike_times = np.array(list(poisson_generator(rate, duration, start_time)))
+    isi = 1. / rate
+    end_time = start_time + duration
+
+    # Draw inter-spike intervals in blocks, sized from the expected number of spikes,
+    #   continuing until the simulated spike times extend past the requested duration
+    rng = check_rng(rng)
+    n_draw = int(1.2 * rate * duration) + 10
+    spike_times = [np.array([])]
+    cur_time = start_time
+    while cur_time <= end_time:
+        block = cur_time + np.cumsum(isi * rng.exponential(size=n_draw))
+        spike_times.append(block)
+        cur_time = block[-1]
+
+    spike_times = np.concatenate(spike_times)
+    spike_times = spike_times[spike_times <= end_time]
 
     return spike_times
 
@@ -3,6 +3,7 @@
 import numpy as np
 
 from spiketools.sim.utils import apply_refractory
+from spiketools.utils.random import check_rng
 from spiketools.utils.checks import check_param_options
 
 ###################################################################################################
@@ -53,7 +54,7 @@ def sim_spiketrain(spike_param, n_samples, method, refractory=None, **kwargs):
 ## Probability based simulations
 
 @apply_refractory('train')
-def sim_spiketrain_prob(p_spiking, n_samples=None, refractory=None):
+def sim_spiketrain_prob(p_spiking, n_samples=None, rng=None, refractory=None):
     """Simulate spikes based on a probability of spiking per sample.
 
     Parameters
@@ -62,6 +63,10 @@ def sim_spiketrain_prob(p_spiking, n_samples=None, refractory=None):
         The probability (per sample) of spiking.
     n_samples : int, optional
         The number of samples to simulate.
+    rng : np.random.Generator or np.random.RandomState or int, optional
+        Random number generator, or seed, to use for the simulation.
+        If not provided, the global numpy random state is used.
+        Should be passed by keyword, as it precedes `refractory` in the function signature.
     refractory : int, optional
         The refractory period to apply to the simulated data, in number of samples.
 
@@ -94,16 +99,15 @@ def sim_spiketrain_prob(p_spiking, n_samples=None, refractory=None):
     >>> sim_spiketrain = sim_spiketrain_prob(p_spiking)
     """
 
-    if isinstance(p_spiking, float):
-        if n_samples is not None:
-            probs = (np.ones(n_samples) * p_spiking)
-        else:
+    if np.ndim(p_spiking) == 0:
+        if n_samples is None:
             msg = "Input variable 'n_samples' must be defined if 'p_spiking' is a float"
             raise ValueError(msg)
+        spike_train = check_rng(rng).random(n_samples) < p_spiking
     else:
-        probs = p_spiking
+        p_spiking = np.asarray(p_spiking)
+        spike_train = check_rng(rng).random(p_spiking.shape) < p_spiking
 
-    spike_train = (probs > np.random.rand(*probs.shape))
     spike_train = spike_train.astype(int)
 
     return spike_train
@@ -112,7 +116,7 @@ def sim_spiketrain_prob(p_spiking, n_samples=None, refractory=None):
 ## Distribution based simulations
 
 @apply_refractory('train')
-def sim_spiketrain_binom(p_spiking, n_samples=None, refractory=None):
+def sim_spiketrain_binom(p_spiking, n_samples=None, rng=None, refractory=None):
     """Simulate spike train from a binomial probability distribution.
 
     Parameters
@@ -121,6 +125,10 @@ def sim_spiketrain_binom(p_spiking, n_samples=None, refractory=None):
         The probability (per sample) of spiking.
     n_samples : int, optional
         The number of samples to simulate.
+    rng : np.random.Generator or np.random.RandomState or int, optional
+        Random number generator, or seed, to use for the simulation.
+        If not provided, the global numpy random state is used.
+        Should be passed by keyword, as it precedes `refractory` in the function signature.
     refractory : int, optional
         The refractory period to apply to the simulated data, in number of samples.
 
@@ -152,16 +160,16 @@ def sim_spiketrain_binom(p_spiking, n_samples=None, refractory=None):
     >>> spike_train = sim_spiketrain_binom(p_spiking, n_samples=5)
     """
 
-    if isinstance(p_spiking, float) & (n_samples is None):
+    if np.ndim(p_spiking) == 0 and n_samples is None:
         raise ValueError("Input variable 'n_samples' must be defined if 'p_spiking' is a float")
 
-    spike_train = np.random.binomial(1, p=p_spiking, size=n_samples)
+    spike_train = check_rng(rng).binomial(1, p=p_spiking, size=n_samples)
 
     return spike_train
 
 
 @apply_refractory('train')
-def sim_spiketrain_poisson(rate, n_samples, fs=1000, refractory=None):
+def sim_spiketrain_poisson(rate, n_samples, fs=1000, rng=None, refractory=None):
     """Simulate spike train from a Poisson distribution.
 
     Parameters
@@ -172,6 +180,10 @@ def sim_spiketrain_poisson(rate, n_samples, fs=1000, refractory=None):
         The number of samples to simulate.
     fs : int, optional, default: 1000
         The sampling rate, in Hz.
+    rng : np.random.Generator or np.random.RandomState or int, optional
+        Random number generator, or seed, to use for the simulation.
+        If not provided, the global numpy random state is used.
+        Should be passed by keyword, as it precedes `refractory` in the function signature.
     refractory : int, optional
         The refractory period to apply to the simulated data, in number of samples.
 
@@ -187,12 +199,8 @@ def sim_spiketrain_poisson(rate, n_samples, fs=1000, refractory=None):
     >>> spike_train = sim_spiketrain_poisson(2, 100)
     """
 
-    spike_train = np.zeros(n_samples)
-
-    # Create a uniform sampling distribution to use to simulate spikes
-    unif = np.random.uniform(0, 1, size=n_samples)
-    mask = unif <= (rate * 1 / fs)
-    spike_train[mask] = 1
+    # Simulate spikes by comparing uniform samples to the probability of spiking per sample
+    spike_train = (check_rng(rng).random(n_samples) <= rate / fs).astype(int)
 
     return spike_train
 
@@ -64,13 +64,10 @@ def sim_trials_poisson(n_trials, rate_pre, rate_post, time_pre=1, time_post=2, r
         Each simulated trial has simulated spike times for the time range [-time_pre, time_post].
     """
 
-    trial_spikes = [None] * n_trials
-    for trial_idx in range(n_trials):
-
-        trial_spikes[trial_idx] = np.append(
-            sim_spiketimes_poisson(rate_pre, time_pre, start_time=-time_pre, refractory=refractory),
-            sim_spiketimes_poisson(rate_post, time_post, start_time=0, refractory=refractory),
-        )
+    trial_spikes = [np.append(
+        sim_spiketimes_poisson(rate_pre, time_pre, start_time=-time_pre, refractory=refractory),
+        sim_spiketimes_poisson(rate_post, time_post, start_time=0, refractory=refractory),
+    ) for _ in range(n_trials)]
 
     return trial_spikes
 
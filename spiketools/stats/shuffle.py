@@ -319,8 +319,7 @@ def shuffle_poisson(spikes, n_shuffles=1000, start_time=0):
     rate = compute_firing_rate(spikes)
     length = (spikes[-1] - spikes[0])
 
-    shuffled_spikes = [None] * n_shuffles
-    for ind in range(n_shuffles):
-        shuffled_spikes[ind] = list(poisson_generator(rate, length, start_time))
+    shuffled_spikes = [list(poisson_generator(rate, length, start_time))
+        for _ in range(n_shuffles)]
 
     return shuffled_spikes
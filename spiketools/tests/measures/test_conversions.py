@@ -7,6 +7,7 @@ from pytest import raises
 from spiketools.measures.spikes import compute_isis
 
 from spiketools.measures.conversions import *
+from spiketools.measures.conversions import _compute_uniform_bin_counts
 
 ###################################################################################################
 ###################################################################################################
@@ -64,6 +65,25 @@ def test_convert_train_to_times():
     spikes = convert_train_to_times(train, fs=500, start_time=start_time)
     spikes == expected + start_time
 
+def test_convert_train_to_packed():
+
+    train = np.zeros(100, dtype=int)
+    np.put(train, [12, 24, 36, 45, 76, 79, 90], 1)
+
+    packed = convert_train_to_packed(train)
+    assert isinstance(packed, np.ndarray)
+    assert packed.dtype == np.uint8
+    assert len(packed) == 13
+
+def test_convert_packed_to_train():
+
+    train = np.zeros(100, dtype=int)
+    np.put(train, [12, 24, 36, 45, 76, 79, 90], 1)
+
+    train_out = convert_packed_to_train(convert_train_to_packed(train), len(train))
+    assert isinstance(train_out, np.ndarray)
+    assert np.array_equal(train_out, train)
+
 def test_convert_isis_to_times(tspikes):
 
     isis = compute_isis(tspikes)
@@ -92,6 +112,23 @@ def test_convert_times_to_counts(tspikes):
     counts = convert_times_to_counts(spikes, 0.250)
     assert np.array_equal(counts, np.array([1, 2, 0, 3]))
 
+    # Check uniform & non-uniform bins match numpy histogram, including spikes on bin edges
+    for bins in [np.arange(0, 10.5, 0.5), np.array([0, 1, 2.5, 3, 5.5, 9.9])]:
+        counts = convert_times_to_counts(tspikes, bins)
+        assert np.array_equal(counts, np.histogram(tspikes, bins)[0])
+
+    # Check bin definitions with a single edge, or a single bin
+    assert len(convert_times_to_counts(tspikes, np.array([1.]))) == 0
+    assert np.array_equal(convert_times_to_counts(tspikes, np.array([1., 5.])),
+                          np.histogram(tspikes, np.array([1., 5.]))[0])
+
+def test_compute_uniform_bin_counts(tspikes):
+
+    bins = np.arange(0, 10.5, 0.5)
+    counts = _compute_uniform_bin_counts(tspikes, bins)
+    assert isinstance(counts, np.ndarray)
+    assert np.array_equal(counts, np.histogram(tspikes, bins)[0])
+
 def test_convert_times_to_rates(tspikes):
 
     # Using precomputed bin definition
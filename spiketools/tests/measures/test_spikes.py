@@ -49,6 +49,16 @@ def test_compute_fano_factor():
     assert isinstance(fano2, float)
     assert fano2 < 1
 
+def test_compute_packed_spike_count():
+
+    spike_train = np.zeros(100, dtype=int)
+    np.put(spike_train, [12, 24, 36, 45, 76, 79, 90], 1)
+    packed_train = np.packbits(spike_train)
+
+    count = compute_packed_spike_count(packed_train)
+    assert isinstance(count, int)
+    assert count == sum(spike_train)
+
 def test_compute_spike_presence(tspikes):
 
     tspike_presence = compute_spike_presence(tspikes, 0.5, [0, 10])
@@ -2,7 +2,13 @@
 
 import numpy as np
 
+from spiketools.objects.trials import TrialSpikes
+from spiketools.measures.conversions import convert_times_to_rates
+
+from spiketools.utils.data import smooth_data
+
 from spiketools.measures.trials import *
+from spiketools.measures.trials import _smooth_trials_fft
 
 ###################################################################################################
 ###################################################################################################
@@ -14,6 +20,32 @@ def test_compute_trial_frs(ttrial_spikes):
     bin_times, trial_frs = compute_trial_frs(trial_spikes, bins)
     assert isinstance(trial_frs, np.ndarray)
     assert trial_frs.shape == (len(trial_spikes), len(bins) - 1)
+    assert np.array_equal(trial_frs[0], convert_times_to_rates(ttrial_spikes, bins))
+
+    # Check with smoothing
+    bin_times, trial_frs_smooth = compute_trial_frs(trial_spikes, bins, smooth=1)
+    assert trial_frs_smooth.shape == trial_frs.shape
+    assert not np.array_equal(trial_frs_smooth, trial_frs)
+
+    # Check with a TrialSpikes object
+    bin_times, trial_frs_obj = compute_trial_frs(TrialSpikes.from_list(trial_spikes), bins)
+    assert np.array_equal(trial_frs_obj, trial_frs)
+
+def test_smooth_trials_fft():
+
+    trial_cfrs = np.random.poisson(5, size=(3, 500)).astype(float)
+    out = _smooth_trials_fft(trial_cfrs, 20)
+    assert out.shape == trial_cfrs.shape
+    assert np.allclose(out, smooth_data(trial_cfrs, 20, axis=1))
+
+    # Check smoothing via compute_trial_frs, with enough bins to use FFT-based smoothing
+    trial_spikes = [np.array([0.5, 0.51])] * 3
+    bin_times, trial_frs = compute_trial_frs(trial_spikes, 0.001, [0, 2], smooth=20)
+    assert trial_frs.shape[1] > 1024
+    assert np.all(trial_frs >= 0)
+    assert np.all(trial_frs[:, -1] == 0)
+    _, trial_frs_unsmoothed = compute_trial_frs(trial_spikes, 0.001, [0, 2])
+    assert np.allclose(trial_frs, smooth_data(trial_frs_unsmoothed, 20, axis=1))
 
 def test_compute_pre_post_rates(ttrial_spikes):
 
@@ -23,6 +55,20 @@ def test_compute_pre_post_rates(ttrial_spikes):
 
     frs_pre, frs_post = compute_pre_post_rates(trial_spikes, pre_window, post_window)
     assert len(frs_pre) == len(frs_post) == len(trial_spikes)
+    assert np.array_equal(frs_pre, np.array([4., 4., 4.]))
+    assert np.array_equal(frs_post, np.array([8., 8., 8.]))
+
+    # Check with an empty trial
+    frs_pre, frs_post = compute_pre_post_rates(\
+        [ttrial_spikes, np.array([])], pre_window, post_window)
+    assert np.array_equal(frs_pre, np.array([4., 0.]))
+    assert np.array_equal(frs_post, np.array([8., 0.]))
+
+    # Check with a TrialSpikes object
+    frs_pre, frs_post = compute_pre_post_rates(\
+        TrialSpikes.from_list([ttrial_spikes, np.array([])]), pre_window, post_window)
+    assert np.array_equal(frs_pre, np.array([4., 0.]))
+    assert np.array_equal(frs_post, np.array([8., 0.]))
 
 def test_compute_segment_frs():
 
@@ -40,6 +86,17 @@ def test_compute_segment_frs():
     assert frs2.shape == (segments.shape[0], segments.shape[1] - 1)
     assert np.array_equal(frs1, frs2)
 
+    # Check spikes on the segment edges, and outside of the segments, per trial
+    trial_spikes = [np.array([0.5, 1., 2., 3., 3.5]), np.array([4., 4.5, 6., 6., 7.])]
+    frs3 = compute_segment_frs(trial_spikes, segments)
+    assert np.array_equal(frs3, np.array([[1, 2], [2, 2]]))
+    for frs_trial, t_spikes, segment in zip(frs3, trial_spikes, segments):
+        assert np.array_equal(frs_trial, convert_times_to_rates(t_spikes, segment))
+
+    # Check with a TrialSpikes object
+    frs4 = compute_segment_frs(TrialSpikes.from_list(trial_spikes), segments)
+    assert np.array_equal(frs4, frs3)
+
 def test_compute_pre_post_averages():
 
     frs1 = np.array([1, 2, 3, 1, 3])
@@ -0,0 +1,48 @@
+"""Tests for spiketools.objects.trials"""
+
+import numpy as np
+
+from pytest import raises
+
+from spiketools.objects.trials import *
+
+###################################################################################################
+###################################################################################################
+
+def test_trial_spikes():
+
+    trial_spikes = TrialSpikes(np.array([0.1, 0.2, 0.15]), np.array([0, 2, 3]))
+    assert len(trial_spikes) == 2 == trial_spikes.n_trials
+    assert np.array_equal(trial_spikes[0], np.array([0.1, 0.2]))
+    assert np.array_equal(trial_spikes[-1], np.array([0.15]))
+    assert np.array_equal(trial_spikes.trial_inds, np.array([0, 0, 1]))
+
+    empty = TrialSpikes()
+    assert len(empty) == 0
+
+    # Check slicing returns a TrialSpikes object of the selected trials
+    sliced = trial_spikes[1:]
+    assert isinstance(sliced, TrialSpikes)
+    assert len(sliced) == 1
+    assert np.array_equal(sliced[0], np.array([0.15]))
+
+    # Check invalid offsets raise an error
+    for offsets in [np.array([1, 2, 3]), np.array([0, 2]), np.array([0, 3, 2, 3])]:
+        with raises(ValueError):
+            TrialSpikes(np.array([0.1, 0.2, 0.15]), offsets)
+
+def test_trial_spikes_from_list(ttrial_spikes):
+
+    trials = [ttrial_spikes, np.array([]), ttrial_spikes]
+    trial_spikes = TrialSpikes.from_list(trials)
+    assert len(trial_spikes) == len(trials)
+    for trial, expected in zip(trial_spikes, trials):
+        assert np.array_equal(trial, expected)
+
+def test_trial_spikes_to_list(ttrial_spikes):
+
+    trials = [ttrial_spikes, np.array([]), ttrial_spikes]
+    trials_out = TrialSpikes.from_list(trials).to_list()
+    assert isinstance(trials_out, list)
+    for trial, expected in zip(trials_out, trials):
+        assert np.array_equal(trial, expected)
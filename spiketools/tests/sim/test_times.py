@@ -14,6 +14,11 @@ def test_sim_spiketimes():
         assert isinstance(times, np.ndarray)
         assert np.all(times < duration)
 
+        # Check simulations are reproducible with a given random number generator
+        times1 = sim_spiketimes(param, duration, method, rng=np.random.default_rng(0))
+        times2 = sim_spiketimes(param, duration, method, rng=np.random.default_rng(0))
+        assert np.array_equal(times1, times2)
+
 def test_sim_spiketimes_poisson():
 
     rate = 10
@@ -34,3 +39,7 @@ def test_sim_spiketimes_poisson():
     assert isinstance(times, np.ndarray)
     assert np.all(times > start_time)
     assert np.all(times < start_time + duration)
+
+    # Check the number of simulated spikes is consistent with the rate
+    times = sim_spiketimes_poisson(500, duration, refractory=None)
+    assert 800 < len(times) < 1200
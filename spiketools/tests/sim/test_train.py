@@ -19,6 +19,11 @@ def test_sim_spiketrain():
         assert np.all(train < 2)
         assert sum(train) < len(train)
 
+        # Check simulations are reproducible with a given random number generator
+        train1 = sim_spiketrain(param, n_samples, method, rng=np.random.default_rng(0))
+        train2 = sim_spiketrain(param, n_samples, method, rng=np.random.default_rng(0))
+        assert np.array_equal(train1, train2)
+
 def test_sim_spiketrain_prob():
 
     # Simulate spike train based on a probability of spiking per sample over time
@@ -44,6 +49,10 @@ def test_sim_spiketrain_prob():
     with raises(ValueError):
         sim_spiketrain_4 = sim_spiketrain_prob(p_spiking_3)
 
+    # Check scalar probabilities given as other numeric types
+    for p_spiking in [1, np.float32(1.), np.array(1.)]:
+        assert np.array_equal(sim_spiketrain_prob(p_spiking, N_SAMPLES), np.ones(N_SAMPLES))
+
 def test_sim_spiketrain_binom():
 
     # Simulate spike train based on a probability of spiking per sample over time
@@ -68,6 +77,8 @@ def test_sim_spiketrain_binom():
 
     with raises(ValueError):
         sim_spiketrain_4 = sim_spiketrain_binom(p_spiking_3)
+    with raises(ValueError):
+        sim_spiketrain_5 = sim_spiketrain_binom(np.array(1.))
 
 def test_sim_spiketrain_poisson():
 
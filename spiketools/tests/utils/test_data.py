@@ -48,6 +48,11 @@ def test_smooth_data():
     assert isinstance(out, np.ndarray)
     assert not np.array_equal(data, out)
 
+    # Check 2d case, smoothing along a specified axis
+    out = smooth_data(data, 0.5, axis=1)
+    assert isinstance(out, np.ndarray)
+    assert np.array_equal(out[0], smooth_data(data[0], 0.5))
+
 def test_drop_nans():
 
     # Check 1d case
@@ -3,6 +3,7 @@
 import numpy as np
 
 from spiketools.utils.epoch import *
+from spiketools.utils.epoch import _get_epoch_inds
 
 ###################################################################################################
 ###################################################################################################
@@ -21,6 +22,44 @@ def test_epoch_spikes_by_event():
     assert np.array_equal(trials[1], np.array([9.25, 9.75, 10.5]) - events[1])
     assert np.array_equal(trials[2], np.array([14.1, 15.2, 15.9]) - events[2])
 
+    # Check with overlapping windows
+    trials = epoch_spikes_by_event(spikes, np.array([5, 6]), [-1, 1])
+    assert np.array_equal(trials[0], np.array([4.25, 5.5]) - 5)
+    assert np.array_equal(trials[1], np.array([5.5, 6.1]) - 6)
+
+    # Check with a reversed window
+    trials_rev = epoch_spikes_by_event(spikes, events, [1, -1])
+    assert all(len(trial) == 0 for trial in trials_rev)
+    ttimes_rev, tvalues_rev = epoch_data_by_event(spikes, spikes, events, [1, -1])
+    assert all(len(trial) == 0 for trial in ttimes_rev + tvalues_rev)
+
+    # Check with unsorted events
+    trials = epoch_spikes_by_event(spikes, np.array([15, 5]), window)
+    assert np.array_equal(trials[0], np.array([14.1, 15.2, 15.9]) - 15)
+    assert np.array_equal(trials[1], np.array([4.25, 5.5]) - 5)
+
+    # Check ragged output
+    trials_list = epoch_spikes_by_event(spikes, events, window)
+    trial_spikes, offsets = epoch_spikes_by_event(spikes, events, window, output='ragged')
+    assert len(offsets) == len(events) + 1
+    for ind, trial in enumerate(trials_list):
+        assert np.array_equal(trial_spikes[offsets[ind]:offsets[ind + 1]], trial)
+
+def test_count_spikes_by_event():
+
+    spikes = np.array([2.5, 3.5, 4.25, 5.5, 6.1, 8., 9.25, 9.75, 10.5, 12., 14.1, 15.2, 15.9])
+    events = np.array([5, 10, 15])
+    window = [-1, 1]
+
+    counts = count_spikes_by_event(spikes, events, window)
+    assert isinstance(counts, np.ndarray)
+    assert np.array_equal(counts, np.array([2, 3, 3]))
+    assert np.array_equal(counts, [len(trial) for trial in \
+        epoch_spikes_by_event(spikes, events, window)])
+
+    # Check a reversed window gives zero counts
+    assert np.array_equal(count_spikes_by_event(spikes, events, [1, -1]), np.array([0, 0, 0]))
+
 def test_epoch_spikes_by_range():
 
     spikes = np.array([2.5, 3.5, 4.25, 5.5, 6.1, 8., 9.25, 9.75, 10.5, 12., 14.1, 15.2, 15.9])
@@ -34,11 +73,29 @@ def test_epoch_spikes_by_range():
     assert np.array_equal(trials[0], np.array([5.5, 6.1, 8., 9.25, 9.75]))
     assert np.array_equal(trials[1], np.array([12., 14.1]))
 
+    # Check that trials are copies, and do not share memory with the input spikes
+    assert not any(np.shares_memory(trial, spikes) for trial in trials)
+
     # Check with time reseting
     trials = epoch_spikes_by_range(spikes, start_times, stop_times, reset=True)
     assert np.array_equal(trials[0], np.array([5.5, 6.1, 8., 9.25, 9.75]) - start_times[0])
     assert np.array_equal(trials[1], np.array([12., 14.1]) - start_times[1])
 
+    # Check reversed ranges give empty trials, with and without reset, and with ragged output
+    for reset in [False, True]:
+        trials_rev = epoch_spikes_by_range(spikes, stop_times, start_times, reset=reset)
+        assert all(len(trial) == 0 for trial in trials_rev)
+    spikes_rev, offsets_rev = epoch_spikes_by_range(\
+        spikes, stop_times, start_times, reset=True, output='ragged')
+    assert len(spikes_rev) == 0
+    assert np.array_equal(offsets_rev, np.array([0, 0, 0]))
+
+    # Check ragged output
+    trial_spikes, offsets = epoch_spikes_by_range(\
+        spikes, start_times, stop_times, reset=True, output='ragged')
+    assert np.array_equal(offsets, np.array([0, 5, 7]))
+    assert np.array_equal(trial_spikes, np.concatenate(trials))
+
 def test_epoch_spikes_by_segment():
 
     spikes = np.array([2.5, 3.5, 4.25, 5.5, 6.1, 8., 9.25, 9.75, 10.5, 12., 14.1, 15.2, 15.9])
@@ -49,6 +106,26 @@ def test_epoch_spikes_by_segment():
     assert len(seg_spikes) == len(segments) - 1
     assert np.array_equal(seg_spikes[0], np.array([2.5, 3.5, 4.25]))
     assert np.array_equal(seg_spikes[-1], np.array([15.2, 15.9]))
+    assert not any(np.shares_memory(seg, spikes) for seg in seg_spikes)
+
+def test_get_epoch_inds():
+
+    times = np.array([1., 2., 3., 4., 5.])
+    start_inds, stop_inds = _get_epoch_inds(times, [1.5, 3.], [3., 5.])
+    assert np.array_equal(start_inds, np.array([1, 2]))
+    assert np.array_equal(stop_inds, np.array([2, 4]))
+
+    start_inds, stop_inds = _get_epoch_inds(times, [1.5, 3.], [3., 5.], include_stop=True)
+    assert np.array_equal(stop_inds, np.array([3, 5]))
+
+    # Check integer times (such as sample indices), with float and out of range keys
+    times = np.array([10, 20, 30, 40, 50])
+    for include_stop in [False, True]:
+        inds_int = _get_epoch_inds(times, [15.5, 20., -5.], [30., 45.2, 1e30], include_stop)
+        inds_float = _get_epoch_inds(\
+            times.astype(float), [15.5, 20., -5.], [30., 45.2, 1e30], include_stop)
+        assert np.array_equal(inds_int[0], inds_float[0])
+        assert np.array_equal(inds_int[1], inds_float[1])
 
 def test_epoch_data_by_time():
 
@@ -99,6 +176,13 @@ def test_epoch_data_by_event():
     ttimes_2d, tvalues_2d = epoch_data_by_event(times, values_2d, events, window)
     assert tvalues_2d[0].ndim == 2
 
+    # Check ragged output
+    ttimes_r, tvalues_r, offsets = epoch_data_by_event(\
+        times, values_2d, events, window, output='ragged')
+    assert np.array_equal(offsets, np.array([0, 2, 5, 8]))
+    assert np.array_equal(ttimes_r, np.concatenate(ttimes_2d))
+    assert np.array_equal(tvalues_r, np.concatenate(tvalues_2d, axis=1))
+
 def test_epoch_data_by_range():
 
     times = np.array([2.5, 3.5, 4.25, 5.5, 6.1, 8., 9.25, 9.75, 10.5, 12., 14.1, 15.2, 15.9])
@@ -121,6 +205,14 @@ def test_epoch_data_by_range():
     assert np.array_equal(ttimes[1], np.array([12.0, 14.1]))
     assert np.array_equal(tvalues[1], np.array([9, 10]))
 
+    # Check that trials are copies, and do not share memory with the inputs, or with each other
+    assert not any(np.shares_memory(ttime, times) for ttime in ttimes)
+    assert not any(np.shares_memory(tvalue, values) for tvalue in tvalues)
+    _, tvalues_ov = epoch_data_by_range(times, values, [5, 6], [10, 10])
+    tvalues_ov[0][:] = -1
+    assert np.array_equal(tvalues_ov[1], np.array([4, 5, 6, 7]))
+    assert np.array_equal(values, np.arange(13))
+
     # Check with time reseting
     ttimes, tvalues = epoch_data_by_range(times, values, start_times, stop_times, reset=True)
     assert np.array_equal(ttimes[0], np.array([5.5, 6.1, 8., 9.25, 9.75]) - start_times[0])
@@ -134,6 +226,13 @@ def test_epoch_data_by_range():
     ttimes_2d, tvalues_2d = epoch_data_by_range(times, values_2d, start_times, stop_times)
     assert tvalues_2d[0].ndim == 2
 
+    # Check ragged output
+    ttimes_r, tvalues_r, offsets = epoch_data_by_range(\
+        times, values_2d, start_times, stop_times, output='ragged')
+    assert np.array_equal(offsets, np.array([0, 5, 7]))
+    assert np.array_equal(ttimes_r, np.concatenate(ttimes_2d))
+    assert np.array_equal(tvalues_r, np.concatenate(tvalues_2d, axis=1))
+
 def test_epoch_data_by_segment():
 
     times = np.array([2.5, 3.5, 4.25, 5.5, 6.1, 8., 9.25, 9.75, 10.5, 12., 14.1, 15.2, 15.9])
@@ -37,6 +37,18 @@ def test_create_mask():
     mask2 = create_mask(data, min_value2, max_value2)
     assert np.array_equal(mask2, np.array([False, True, True, False, False]))
 
+    # Test with only one bound, and that NaN values are excluded
+    data_nan = np.array([0.5, np.nan, 1.5, 2., 2.5])
+    mask3 = create_mask(data_nan, min_value=1.)
+    assert np.array_equal(mask3, np.array([False, False, True, True, True]))
+    mask4 = create_mask(data_nan, max_value=2.)
+    assert np.array_equal(mask4, np.array([True, False, True, False, False]))
+
+    # Test that infinite values are excluded
+    data_inf = np.array([-np.inf, 1., np.inf])
+    assert np.array_equal(create_mask(data_inf, min_value=0.), np.array([False, True, False]))
+    assert np.array_equal(create_mask(data_inf), np.array([True, True, False]))
+
 def test_create_nan_mask():
 
     data = np.array([0.5, 1.0, np.nan, 1.5, 2.0, np.nan, 2.5])
@@ -120,6 +132,11 @@ def test_get_ind_by_time():
     assert get_ind_by_time(times, 3.15, time_threshold=0.25) == 2
     assert get_ind_by_time(times, 3.5, time_threshold=0.25) == -1
 
+    # test timepoints outside of the range of times, and ties between times
+    assert get_ind_by_time(times, 0.25) == 0
+    assert get_ind_by_time(times, 6.5) == 4
+    assert get_ind_by_time(times, 3.5) == 2
+
 def test_get_inds_by_values():
 
     values = np.array([10, 20, 15, 25, 50])
@@ -160,6 +177,11 @@ def test_get_inds_by_times():
     inds_empty = get_inds_by_times(times, np.array([]))
     assert len(inds_empty) == 0
 
+    # Test with repeated timestamps, which should return the first index
+    times_rep = np.array([1, 2, 2, 3, 3, 4])
+    inds = get_inds_by_times(times_rep, [2.25, 2.75, 3.0])
+    assert np.array_equal(inds, np.array([1, 3, 3]))
+
 def test_get_value_by_time():
 
     times = np.array([1, 2, 3, 4, 5])
@@ -217,6 +239,18 @@ def test_get_values_by_times():
     outputs = get_values_by_times(times, values_2d.T, timepoints)
     assert len(outputs) == len(timepoints)
     assert np.array_equal(outputs, np.array([[8, 6], [8, 6]]).T)
+    out_thresh_null_col = get_values_by_times(times, values_2d.T, timepoints,
+                                              time_threshold=0.2, drop_null=False)
+    assert np.array_equal(out_thresh_null_col, np.array([[np.nan, 6], [np.nan, 6]]).T,
+                          equal_nan=True)
+
+    # Test without null dropping, for a single timepoint & a single row, outputs are squeezed
+    out_single = get_values_by_times(times, values_2d, np.array([4.15]), drop_null=False)
+    assert out_single.shape == (2,)
+    out_single_1d = get_values_by_times(times, values_1d, np.array([4.15]), drop_null=False)
+    assert out_single_1d.shape == (1,)
+    out_single_row = get_values_by_times(times, values_2d[0:1, :], timepoints, drop_null=False)
+    assert out_single_row.shape == (2,)
 
     # Test empty extraction
     outputs_empty = get_values_by_times(times, values_1d, np.array([]))
@@ -248,6 +282,28 @@ def test_get_values_by_time_range():
     assert np.array_equal(times_out_2d, np.array([2, 3, 4]))
     assert np.array_equal(values_out_2d, np.array([[8, 4, 6], [8, 4, 6]]).T)
 
+    # Test with assuming sorted timestamps matches the default
+    for values in [values_1d, values_2d, values_2d.T]:
+        outputs = get_values_by_time_range(times, values, 2, 4)
+        outputs_sorted = get_values_by_time_range(times, values, 2, 4, assume_sorted=True)
+        for output, output_sorted in zip(outputs, outputs_sorted):
+            assert np.array_equal(output, output_sorted)
+            assert not np.shares_memory(output_sorted, times)
+            assert not np.shares_memory(output_sorted, values)
+
+    # Test with an empty time range, with and without assuming sorted timestamps
+    for assume_sorted in [False, True]:
+        times_out, values_out = get_values_by_time_range(\
+            times, values_2d, 4, 2, assume_sorted=assume_sorted)
+        assert len(times_out) == 0
+        assert values_out.shape == (2, 0)
+
+    # Test unsorted timestamps, which requires the default (masking) approach
+    times_unsorted = np.array([3, 1, 5, 2, 4])
+    times_out, values_out = get_values_by_time_range(times_unsorted, values_1d, 2, 4)
+    assert np.array_equal(times_out, np.array([3, 2, 4]))
+    assert np.array_equal(values_out, np.array([5, 6, 7]))
+
 def test_threshold_spikes_by_times():
 
     spikes = np.array([0.5, 1., 1.5, 2., 2.5])
@@ -258,6 +314,10 @@ def test_threshold_spikes_by_times():
     assert isinstance(out, np.ndarray)
     assert np.array_equal(out, np.array([0.5, 1., 2.]))
 
+    # Test spikes outside the range of timestamps, and exactly at the threshold (excluded)
+    out_edges = threshold_spikes_by_times(np.array([0.25, 0.3, 3.2, 3.25]), times, threshold)
+    assert np.array_equal(out_edges, np.array([0.3, 3.2]))
+
     # Test empty extraction
     out_empty = threshold_spikes_by_times(np.array([]), times, threshold)
     assert len(out_empty) == 0
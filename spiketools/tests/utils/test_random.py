@@ -2,6 +2,8 @@
 
 import numpy as np
 
+from pytest import raises
+
 from spiketools.utils.random import *
 
 ###################################################################################################
@@ -23,3 +25,16 @@ def test_set_random_state():
     seed = 234
     rng = set_random_state(seed)
     assert seed == rng.get_state()[1][0]
+
+def test_check_rng():
+
+    assert check_rng() is np.random
+
+    rng = np.random.default_rng(123)
+    assert check_rng(rng) is rng
+
+    rng = check_rng(123)
+    assert isinstance(rng, np.random.Generator)
+
+    with raises(TypeError):
+        check_rng(0.002)
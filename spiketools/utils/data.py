@@ -4,7 +4,7 @@ from copy import deepcopy
 
 import numpy as np
 
-from scipy.ndimage import gaussian_filter
+from scipy.ndimage import gaussian_filter, gaussian_filter1d
 
 from spiketools.utils.extract import create_nan_mask
 from spiketools.utils.checks import check_array_orientation, check_param_options, check_bin_range
@@ -66,7 +66,7 @@ def compute_range(data):
     return np.nanmin(data), np.nanmax(data)
 
 
-def smooth_data(data, sigma):
+def smooth_data(data, sigma, axis=None):
     """Smooth an array of data, using a gaussian kernel.
 
     Parameters
@@ -75,6 +75,9 @@ def smooth_data(data, sigma):
         Data to smooth.
     sigma : float
         Standard deviation of the gaussian kernel to apply for smoothing.
+    axis : int, optional
+        If provided, the axis to smooth along, smoothing each vector along this axis independently.
+        If not provided, smoothing is applied across all dimensions of the data.
 
     Returns
     -------
@@ -93,12 +96,22 @@ def smooth_data(data, sigma):
     >>> data = np.array([1, 3, 5, 7, 9])
     >>> smooth_data(data, sigma=0.8)
     array([1, 3, 5, 6, 8])
+
+    Smooth each row of a 2d data array, independently:
+
+    >>> data = np.array([[1, 3, 5, 7, 9], [2, 2, 2, 2, 2]])
+    >>> smooth_data(data, sigma=0.8, axis=1)
+    array([[1, 3, 5, 6, 8],
+           [2, 2, 2, 2, 2]])
     """
 
     data = deepcopy(data)
     data[np.isnan(data)] = 0
 
-    data = gaussian_filter(data, sigma=sigma)
+    if axis is None:
+        data = gaussian_filter(data, sigma=sigma)
+    else:
+        data = gaussian_filter1d(data, sigma=sigma, axis=axis)
 
     return data
 
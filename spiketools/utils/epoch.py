@@ -2,13 +2,13 @@
 
 import numpy as np
 
-from spiketools.utils.checks import check_param_lengths
-from spiketools.utils.extract import get_range, get_value_by_time, get_values_by_time_range
+from spiketools.utils.checks import check_param_lengths, check_param_options, check_axis
+from spiketools.utils.extract import get_inds_by_times
 
 ###################################################################################################
 ###################################################################################################
 
-def epoch_spikes_by_event(spikes, events, window):
+def epoch_spikes_by_event(spikes, events, window, output='list'):
     """Epoch spiking data into trials, based on events of interest.
 
     Parameters
@@ -19,15 +19,23 @@ def epoch_spikes_by_event(spikes, events, window):
         The set of event times, in seconds, to extract from the data.
     window : list of [float, float]
         The time window, in seconds, to extract around each event.
+    output : {'list', 'ragged'}, optional, default: 'list'
+        The format of the output.
+        If 'list', returns a list of spike times per trial.
+        If 'ragged', returns the spike times across all trials in a single array, with offsets.
 
     Returns
     -------
-    trials : list of 1d array
+    trials : list of 1d array or tuple of (1d array, 1d array)
         Spike times, in seconds, per trial.
+        If `output` is 'ragged', this is a tuple of (spikes, offsets), where `spikes` is the
+        spike times concatenated across trials, and trial `i` is `spikes[offsets[i]:offsets[i+1]]`.
 
     Notes
     -----
     For each trial, the returned spike times will be relative to each event time, set as zero.
+    This function assumes that `spikes` is sorted (monotonically increasing).
+    The 'ragged' output can be used to initialize a `TrialSpikes` object.
 
     Examples
     --------
@@ -40,14 +48,62 @@ def epoch_spikes_by_event(spikes, events, window):
     [array([0.1, 0.2]), array([0.1]), array([0.1])]
     """
 
-    trials = [None] * len(events)
-    for ind, event in enumerate(events):
-        trials[ind] = get_range(spikes, event + window[0], event + window[1]) - event
+    check_param_options(output, 'output', ['list', 'ragged'])
+
+    events = np.asarray(events)
+    start_inds, stop_inds = _get_epoch_inds(spikes, events + window[0], events + window[1])
+
+    if output == 'list':
+        trials = _subtract_epochs(spikes, start_inds, stop_inds, events)
+    else:
+        inds, offsets = _get_epoch_flat_inds(start_inds, stop_inds)
+        trials = (spikes[inds] - np.repeat(events, np.diff(offsets)), offsets)
 
     return trials
 
 
-def epoch_spikes_by_range(spikes, start_times, stop_times, reset=False):
+def count_spikes_by_event(spikes, events, window):
+    """Count the number of spikes per trial, based on events of interest.
+
+    Parameters
+    ----------
+    spikes : 1d array
+        Spike times, in seconds.
+    events : 1d array
+        The set of event times, in seconds, to count spikes around.
+    window : list of [float, float]
+        The time window, in seconds, to count spikes within around each event.
+
+    Returns
+    -------
+    counts : 1d array of int
+        The number of spikes per trial.
+
+    Notes
+    -----
+    Spikes are counted with the same time windows as `epoch_spikes_by_event`, but without
+    extracting the spike times of each trial.
+    This function assumes that `spikes` is sorted (monotonically increasing).
+
+    Examples
+    --------
+    Count spikes within an event window:
+
+    >>> spikes = np.array([0.3, 0.4, 0.5, 0.6, 0.7, 0.9, 1.3])
+    >>> events = np.array([0.2, 0.8, 1.2])
+    >>> window = [0.0, 0.25]
+    >>> count_spikes_by_event(spikes, events, window)
+    array([2, 1, 1])
+    """
+
+    events = np.asarray(events)
+    start_inds, stop_inds = _get_epoch_inds(spikes, events + window[0], events + window[1])
+    counts = np.maximum(stop_inds - start_inds, 0)
+
+    return counts
+
+
+def epoch_spikes_by_range(spikes, start_times, stop_times, reset=False, output='list'):
     """Epoch spiking data into trials, based on time ranges of interest.
 
     Parameters
@@ -58,11 +114,22 @@ def epoch_spikes_by_range(spikes, start_times, stop_times, reset=False):
         The start and stop times, in seconds, of each epoch.
     reset : bool, optional, default: False
         Whether to reset each set of trial timestamps to start at zero.
+    output : {'list', 'ragged'}, optional, default: 'list'
+        The format of the output.
+        If 'list', returns a list of spike times per trial.
+        If 'ragged', returns the spike times across all trials in a single array, with offsets.
 
     Returns
     -------
-    trials : list of 1d array
+    trials : list of 1d array or tuple of (1d array, 1d array)
         Spike times per trial.
+        If `output` is 'ragged', this is a tuple of (spikes, offsets), where `spikes` is the
+        spike times concatenated across trials, and trial `i` is `spikes[offsets[i]:offsets[i+1]]`.
+
+    Notes
+    -----
+    This function assumes that `spikes` is sorted (monotonically increasing).
+    The 'ragged' output can be used to initialize a `TrialSpikes` object.
 
     Examples
     --------
@@ -76,13 +143,22 @@ def epoch_spikes_by_range(spikes, start_times, stop_times, reset=False):
     """
 
     check_param_lengths([start_times, stop_times], ['start_times', 'stop_times'])
+    check_param_options(output, 'output', ['list', 'ragged'])
+
+    start_times, stop_times = np.asarray(start_times), np.asarray(stop_times)
+    start_inds, stop_inds = _get_epoch_inds(spikes, start_times, stop_times)
 
-    trials = [None] * len(start_times)
-    for ind, (start, stop) in enumerate(zip(start_times, stop_times)):
-        trial = get_range(spikes, start, stop)
+    if output == 'list':
+        if reset:
+            trials = _subtract_epochs(spikes, start_inds, stop_inds, start_times)
+        else:
+            trials = _split_epochs(spikes, start_inds, stop_inds)
+    else:
+        inds, offsets = _get_epoch_flat_inds(start_inds, stop_inds)
+        trial_spikes = spikes[inds]
         if reset:
-            trial = trial - start
-        trials[ind] = trial
+            trial_spikes = trial_spikes - np.repeat(start_times, np.diff(offsets))
+        trials = (trial_spikes, offsets)
 
     return trials
 
@@ -103,6 +179,10 @@ def epoch_spikes_by_segment(spikes, segments):
     segment_spikes : list of 1d array
         Spike times per segment.
 
+    Notes
+    -----
+    This function assumes that `spikes` is sorted (monotonically increasing).
+
     Examples
     --------
     Epoch spiking data based on segments:
@@ -113,9 +193,8 @@ def epoch_spikes_by_segment(spikes, segments):
     [array([0.1, 0.3]), array([0.4, 0.5]), array([0.6, 0.7]), array([1. , 1.4])]
     """
 
-    segment_spikes = [None] * (len(segments) - 1)
-    for ind, (seg_start, seg_end) in enumerate(zip(segments, segments[1:])):
-        segment_spikes[ind] = get_range(spikes, seg_start, seg_end)
+    start_inds, stop_inds = _get_epoch_inds(spikes, segments[:-1], segments[1:])
+    segment_spikes = _split_epochs(spikes, start_inds, stop_inds)
 
     return segment_spikes
 
@@ -151,14 +230,17 @@ def epoch_data_by_time(timestamps, values, timepoints, time_threshold=None):
     [1.5, 2.5, 4.0]
     """
 
-    trials = [None] * len(timepoints)
-    for ind, timepoint in enumerate(timepoints):
-        trials[ind] = get_value_by_time(timestamps, values, timepoint, time_threshold)
+    # Find the indices for all timepoints at once, and select values along the time axis
+    axis = check_axis(None, values)
+    inds = get_inds_by_times(timestamps, timepoints, time_threshold, drop_null=False)
+    selected = np.moveaxis(values.take(inds, axis=axis), axis, 0)
+
+    trials = [value if ind >= 0 else np.nan for ind, value in zip(inds, selected)]
 
     return trials
 
 
-def epoch_data_by_event(timestamps, values, events, window):
+def epoch_data_by_event(timestamps, values, events, window, output='list'):
     """Epoch data into trials, based on events of interest.
 
     Parameters
@@ -171,13 +253,27 @@ def epoch_data_by_event(timestamps, values, events, window):
         The set of event times to extract from the data.
     window : list of [float, float]
         The time window to extract around each event, in seconds.
+    output : {'list', 'ragged'}, optional, default: 'list'
+        The format of the output.
+        If 'list', returns lists of timestamps and values per trial.
+        If 'ragged', returns the timestamps and values across all trials in single arrays,
+        with offsets.
 
     Returns
     -------
-    trial_timestamps : list of 1d array
+    trial_timestamps : list of 1d array or 1d array
         The timestamps, per trial.
-    trial_values : list of 1d array
+        If `output` is 'ragged', the timestamps concatenated across trials.
+    trial_values : list of 1d array or ndarray
         The values, per trial.
+        If `output` is 'ragged', the values concatenated across trials, along the time axis.
+    offsets : 1d array
+        The start position of each trial in the concatenated outputs, with a final entry for the
+        end of the last trial. Only returned if `output` is 'ragged'.
+
+    Notes
+    -----
+    This function assumes that `timestamps` is sorted (monotonically increasing).
 
     Examples
     --------
@@ -191,18 +287,29 @@ def epoch_data_by_event(timestamps, values, events, window):
     ([array([0. , 0.2]), array([0.1])], [array([1.5, 2. ]), array([2.5])])
     """
 
-    trial_timestamps = [None] * len(events)
-    trial_values = [None] * len(events)
-    for ind, event in enumerate(events):
-        ttimes, tvalues = get_values_by_time_range(\
-            timestamps, values, event + window[0], event + window[1])
-        trial_timestamps[ind] = ttimes - event
-        trial_values[ind] = tvalues
+    check_param_options(output, 'output', ['list', 'ragged'])
+
+    events = np.asarray(events)
+    start_inds, stop_inds = _get_epoch_inds(\
+        timestamps, events + window[0], events + window[1], include_stop=True)
+
+    # Make all trial timestamps relative to their events in one pass across the selected samples
+    inds, offsets = _get_epoch_flat_inds(start_inds, stop_inds)
+    trial_timestamps = timestamps[inds] - np.repeat(events, np.diff(offsets))
 
-    return trial_timestamps, trial_values
+    if output == 'list':
+        axis = check_axis(None, values)
+        trial_timestamps = _slice_epochs(trial_timestamps, offsets[:-1], offsets[1:])
+        trial_values = _slice_epochs(values.take(inds, axis=axis), offsets[:-1], offsets[1:], axis)
+        outputs = trial_timestamps, trial_values
+    else:
+        trial_values = values.take(inds, axis=check_axis(None, values))
+        outputs = trial_timestamps, trial_values, offsets
 
+    return outputs
 
-def epoch_data_by_range(timestamps, values, start_times, stop_times, reset=False):
+
+def epoch_data_by_range(timestamps, values, start_times, stop_times, reset=False, output='list'):
     """Epoch data into trials, based on time ranges of interest.
 
     Parameters
@@ -215,13 +322,27 @@ def epoch_data_by_range(timestamps, values, start_times, stop_times, reset=False
         The start and stop times, in seconds, of each epoch.
     reset : bool, optional, default: False
         If True, resets the values in each epoch range to the start time of that epoch.
+    output : {'list', 'ragged'}, optional, default: 'list'
+        The format of the output.
+        If 'list', returns lists of timestamps and values per trial.
+        If 'ragged', returns the timestamps and values across all trials in single arrays,
+        with offsets.
 
     Returns
     -------
-    trial_timestamps : list of 1d array
+    trial_timestamps : list of 1d array or 1d array
         The timestamps, per trial.
-    trial_values : list of 1d array
+        If `output` is 'ragged', the timestamps concatenated across trials.
+    trial_values : list of 1d array or ndarray
         The values, per trial.
+        If `output` is 'ragged', the values concatenated across trials, along the time axis.
+    offsets : 1d array
+        The start position of each trial in the concatenated outputs, with a final entry for the
+        end of the last trial. Only returned if `output` is 'ragged'.
+
+    Notes
+    -----
+    This function assumes that `timestamps` is sorted (monotonically increasing).
 
     Examples
     --------
@@ -236,17 +357,27 @@ def epoch_data_by_range(timestamps, values, start_times, stop_times, reset=False
     """
 
     check_param_lengths([start_times, stop_times], ['start_times', 'stop_times'])
+    check_param_options(output, 'output', ['list', 'ragged'])
+
+    start_times, stop_times = np.asarray(start_times), np.asarray(stop_times)
+    start_inds, stop_inds = _get_epoch_inds(timestamps, start_times, stop_times, include_stop=True)
 
-    trial_timestamps = [None] * len(start_times)
-    trial_values = [None] * len(start_times)
-    for ind, (start, stop) in enumerate(zip(start_times, stop_times)):
-        ttimes, tvalues = get_values_by_time_range(timestamps, values, start, stop)
+    if output == 'list':
         if reset:
-            ttimes = ttimes - start
-        trial_timestamps[ind] = ttimes
-        trial_values[ind] = tvalues
+            trial_timestamps = _subtract_epochs(timestamps, start_inds, stop_inds, start_times)
+        else:
+            trial_timestamps = _split_epochs(timestamps, start_inds, stop_inds)
+        trial_values = _split_epochs(values, start_inds, stop_inds, check_axis(None, values))
+        outputs = trial_timestamps, trial_values
+    else:
+        inds, offsets = _get_epoch_flat_inds(start_inds, stop_inds)
+        trial_timestamps = timestamps[inds]
+        if reset:
+            trial_timestamps = trial_timestamps - np.repeat(start_times, np.diff(offsets))
+        trial_values = values.take(inds, axis=check_axis(None, values))
+        outputs = trial_timestamps, trial_values, offsets
 
-    return trial_timestamps, trial_values
+    return outputs
 
 
 def epoch_data_by_segment(timestamps, values, segments):
@@ -269,6 +400,10 @@ def epoch_data_by_segment(timestamps, values, segments):
     segment_values : list of 1d array
         The values, per segment.
 
+    Notes
+    -----
+    This function assumes that `timestamps` is sorted (monotonically increasing).
+
     Examples
     --------
     Epoch data values into segments:
@@ -280,10 +415,241 @@ def epoch_data_by_segment(timestamps, values, segments):
     ([array([0.1]), array([0.4]), array([0.6, 0.7])], [array([1]), array([3]), array([5, 7])])
     """
 
-    segment_timestamps = [None] * (len(segments) - 1)
-    segment_values = [None] * (len(segments) - 1)
-    for ind, (seg_start, seg_end) in enumerate(zip(segments, segments[1:])):
-        segment_timestamps[ind], segment_values[ind] = get_values_by_time_range(\
-            timestamps, values, seg_start, seg_end)
+    start_inds, stop_inds = _get_epoch_inds(\
+        timestamps, segments[:-1], segments[1:], include_stop=True)
+
+    segment_timestamps = _split_epochs(timestamps, start_inds, stop_inds)
+    segment_values = _split_epochs(values, start_inds, stop_inds, check_axis(None, values))
 
     return segment_timestamps, segment_values
+
+
+def _get_epoch_inds(times, starts, stops, include_stop=False):
+    """Get the indices of the start and stop of each epoch, from a sorted array of times.
+
+    Parameters
+    ----------
+    times : 1d array
+        Time values, in seconds, which should be sorted.
+    starts, stops : 1d array or list of float
+        The start and stop times, in seconds, of each epoch.
+    include_stop : bool, optional, default: False
+        Whether to include time values equal to the stop time in each epoch.
+
+    Returns
+    -------
+    start_inds, stop_inds : 1d array of int
+        Indices of the start and stop of each epoch, such that each epoch is `times[start:stop]`.
+
+    Notes
+    -----
+    The indices for all epochs are found with a single search each for starts & stops,
+    rather than searching (or masking) the time values separately for each epoch.
+    All arrays are converted to a shared, contiguous dtype up front, so that if a conversion
+    of the time values is needed, it happens once rather than within each search.
+    For integer time values (such as sample indices), the keys are converted to equivalent
+    integer values, so that the time values do not need to be converted to float.
+    """
+
+    times = np.asarray(times)
+    starts, stops = np.asarray(starts), np.asarray(stops)
+    stop_side = 'right' if include_stop else 'left'
+
+    if np.issubdtype(times.dtype, np.integer):
+        starts = _convert_int_keys(starts, times.dtype, side='left')
+        stops = _convert_int_keys(stops, times.dtype, side=stop_side)
+
+    dtype = np.result_type(times, starts, stops)
+    times, starts, stops = \
+        [np.ascontiguousarray(arr, dtype=dtype) for arr in [times, starts, stops]]
+
+    start_inds = _search_sorted_keys(times, starts, side='left')
+    stop_inds = _search_sorted_keys(times, stops, side=stop_side)
+
+    return start_inds, stop_inds
+
+
+def _convert_int_keys(keys, dtype, side='left'):
+    """Convert search keys to an integer dtype, giving the same search results for integer data.
+
+    Parameters
+    ----------
+    keys : 1d array
+        Time values to search for.
+    dtype : dtype
+        Integer dtype of the time values to be searched.
+    side : {'left', 'right'}
+        Which index is to be returned for keys equal to a time value, as in `np.searchsorted`.
+
+    Returns
+    -------
+    keys : 1d array
+        The keys, converted to `dtype` if all keys can be represented exactly.
+        Otherwise, the keys are returned unchanged.
+
+    Notes
+    -----
+    For integer data, searching for non-integer keys on the left side is equivalent to
+    searching for the key rounded up, and on the right side to the key rounded down.
+    """
+
+    if not np.issubdtype(keys.dtype, np.integer):
+        keys = np.ceil(keys) if side == 'left' else np.floor(keys)
+
+    info = np.iinfo(dtype)
+    if np.all((keys >= max(info.min, -2**53)) & (keys <= min(info.max, 2**53))):
+        keys = keys.astype(dtype)
+
+    return keys
+
+
+def _search_sorted_keys(times, keys, side='left'):
+    """Find the indices into a sorted array of times for a set of keys, searching in sorted order.
+
+    Parameters
+    ----------
+    times : 1d array
+        Time values, in seconds, which should be sorted.
+    keys : 1d array or list of float
+        Time values to find the indices of.
+    side : {'left', 'right'}
+        Which index to return for keys equal to a time value, as in `np.searchsorted`.
+
+    Returns
+    -------
+    inds : 1d array of int
+        Indices into `times` for each key, in the original order of the keys.
+
+    Notes
+    -----
+    When the keys are sorted, each search can start from the position of the previous one,
+    scanning forward through `times` rather than jumping around it. Unsorted keys (for example,
+    events in a shuffled order) are therefore searched in sorted order, and then reordered.
+    """
+
+    keys = np.asarray(keys)
+
+    if np.all(keys[1:] >= keys[:-1]):
+        inds = np.searchsorted(times, keys, side=side)
+    else:
+        order = np.argsort(keys, kind='stable')
+        inds = np.empty(len(keys), dtype=np.intp)
+        inds[order] = np.searchsorted(times, keys[order], side=side)
+
+    return inds
+
+
+def _split_epochs(data, start_inds, stop_inds, axis=0):
+    """Split an array into epochs, based on the start and stop index of each epoch.
+
+    Parameters
+    ----------
+    data : ndarray
+        Data to split.
+    start_inds, stop_inds : 1d array of int
+        Indices of the start and stop of each epoch.
+    axis : int, optional, default: 0
+        The axis of the data to split along.
+
+    Returns
+    -------
+    epochs : list of ndarray
+        The data, per epoch.
+
+    Notes
+    -----
+    The data for all epochs are gathered into a new array, such that the returned epochs do not
+    share memory with the input array, or with each other, including for overlapping epochs.
+    Epochs with a stop index before the start index are empty.
+    """
+
+    inds, offsets = _get_epoch_flat_inds(start_inds, stop_inds)
+    epochs = _slice_epochs(np.take(data, inds, axis=axis), offsets[:-1], offsets[1:], axis)
+
+    return epochs
+
+
+def _slice_epochs(data, start_inds, stop_inds, axis=0):
+    """Slice epochs from an array, based on the start and stop index of each epoch.
+
+    Parameters
+    ----------
+    data : ndarray
+        Data to slice.
+    start_inds, stop_inds : 1d array of int
+        Indices of the start and stop of each epoch.
+    axis : int, optional, default: 0
+        The axis of the data to slice along.
+
+    Returns
+    -------
+    epochs : list of ndarray
+        The data, per epoch, as views of the input array.
+    """
+
+    if axis == 0:
+        epochs = [data[start:stop] for start, stop in zip(start_inds.tolist(), stop_inds.tolist())]
+    else:
+        index = [slice(None)] * data.ndim
+        epochs = []
+        for start, stop in zip(start_inds.tolist(), stop_inds.tolist()):
+            index[axis] = slice(start, stop)
+            epochs.append(data[tuple(index)])
+
+    return epochs
+
+
+def _subtract_epochs(data, start_inds, stop_inds, values):
+    """Extract epochs from an array, subtracting a value from each epoch.
+
+    Parameters
+    ----------
+    data : 1d array
+        Data to extract epochs from.
+    start_inds, stop_inds : 1d array of int
+        Indices of the start and stop of each epoch.
+    values : 1d array
+        The value to subtract from each epoch.
+
+    Returns
+    -------
+    epochs : list of 1d array
+        The data, per epoch, with the corresponding value subtracted.
+
+    Notes
+    -----
+    The data for all epochs are gathered and subtracted in a single vectorized pass, into one
+    output array, with each epoch returned as a view into this array.
+    """
+
+    inds, offsets = _get_epoch_flat_inds(start_inds, stop_inds)
+    out = np.subtract(data[inds], np.repeat(values, np.diff(offsets)))
+
+    epochs = _slice_epochs(out, offsets[:-1], offsets[1:])
+
+    return epochs
+
+
+def _get_epoch_flat_inds(start_inds, stop_inds):
+    """Get the indices of all elements across a set of epochs, concatenated across epochs.
+
+    Parameters
+    ----------
+    start_inds, stop_inds : 1d array of int
+        Indices of the start and stop of each epoch.
+
+    Returns
+    -------
+    inds : 1d array of int
+        Indices of each element in each epoch, concatenated across epochs.
+    offsets : 1d array of int
+        The start position of each epoch in `inds`, with a final entry for the end of the last
+        epoch, such that epoch `i` is `inds[offsets[i]:offsets[i + 1]]`.
+    """
+
+    # Epochs with a stop before their start (reversed windows or ranges) are empty
+    counts = np.maximum(stop_inds, start_inds) - start_inds
+    offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.intp)
+    inds = np.arange(offsets[-1]) + np.repeat(start_inds - offsets[:-1], counts)
+
+    return inds, offsets
@@ -38,7 +38,9 @@ def create_mask(data, min_value=None, max_value=None):
     # Make the mask inclusive for min / exclusive for max value
     #   If inclusive for both, there can be issues double-selecting spikes
     #   For example, if a spike == time_range, and select contiguous segments
-    mask = np.logical_and(data >= min_value, data < max_value)
+    #   Note: both comparisons are always applied, which excludes any NaN or +inf values
+    mask = data >= min_value
+    np.logical_and(mask, data < max_value, out=mask)
 
     return mask
 
@@ -233,6 +235,10 @@ def get_ind_by_time(timestamps, timepoint, time_threshold=None):
     ind : int
         The index value for the requested timepoint, or -1 if out of threshold range.
 
+    Notes
+    -----
+    This function assumes that `timestamps` is sorted (monotonically increasing).
+
     Examples
     --------
     Get the index for a specified timepoint:
@@ -242,7 +248,12 @@ def get_ind_by_time(timestamps, timepoint, time_threshold=None):
     4
     """
 
-    return get_ind_by_value(timestamps, timepoint, time_threshold)
+    check_param_type(timepoint, 'timepoint', (int, float, np.int64, np.float64))
+    assert not np.isnan(timepoint), "The given `timepoint` is nan - cannot continue."
+
+    ind = int(_get_closest_inds(timestamps, timepoint, time_threshold))
+
+    return ind
 
 
 def get_inds_by_values(values, select, threshold=None, drop_null=True):
@@ -307,6 +318,10 @@ def get_inds_by_times(timestamps, timepoints, time_threshold=None, drop_null=Tru
     inds : 1d array
         Indices for all requested timepoints.
 
+    Notes
+    -----
+    This function assumes that `timestamps` is sorted (monotonically increasing).
+
     Examples
     --------
     Get the corresponding indices for specified timepoints:
@@ -317,7 +332,70 @@ def get_inds_by_times(timestamps, timepoints, time_threshold=None, drop_null=Tru
     array([1, 3, 5])
     """
 
-    return get_inds_by_values(timestamps, timepoints, time_threshold, drop_null)
+    timepoints = np.asarray(timepoints)
+    assert not np.any(np.isnan(timepoints)), "The given `timepoints` contain nan - cannot continue."
+
+    inds = _get_closest_inds(timestamps, timepoints, time_threshold)
+
+    if drop_null:
+        inds = inds[inds >= 0]
+
+    return inds
+
+
+def _get_closest_inds(timestamps, timepoints, time_threshold=None, return_dists=False):
+    """Get the indices of the closest timestamps to a set of timepoints.
+
+    Parameters
+    ----------
+    timestamps : 1d array
+        Timestamps, in seconds, which should be sorted.
+    timepoints : float or 1d array
+        The time value(s), in seconds, to extract indices for.
+    time_threshold : float, optional
+        The threshold that the closest time value must be within to be returned.
+        If the temporal distance is greater than the threshold, output is -1.
+    return_dists : bool, optional, default: False
+        Whether to also return the temporal distance to the closest timestamp(s).
+
+    Returns
+    -------
+    inds : int or 1d array
+        Indices for the requested timepoint(s), or -1 if out of threshold range.
+    dists : float or 1d array
+        The temporal distance between each timepoint and its closest timestamp.
+        Only returned if `return_dists` is True.
+
+    Notes
+    -----
+    This uses a binary search of the sorted timestamps, checking the timestamps on either side
+    of the insertion point of each timepoint. In the case of ties, the earlier index is returned.
+    """
+
+    # Get the indices of the timestamps immediately before & after each timepoint
+    right = np.searchsorted(timestamps, timepoints)
+    left = np.clip(right - 1, 0, len(timestamps) - 1)
+    right = np.minimum(right, len(timestamps) - 1)
+
+    # If there are repeated timestamps, step back to the first instance of the earlier value
+    left = np.searchsorted(timestamps, timestamps[left])
+
+    # Select the closer timestamp, keeping the difference to it for computing distances
+    left_diff = timepoints - timestamps[left]
+    right_diff = timestamps[right] - timepoints
+    use_left = left_diff <= right_diff
+    inds = np.where(use_left, left, right)
+
+    if time_threshold or return_dists:
+        # Timepoints outside the range of timestamps have a negative difference, so take the abs
+        dists = np.abs(np.where(use_left, left_diff, right_diff))
+        if time_threshold:
+            inds = np.where(dists > time_threshold, -1, inds)
+
+    if return_dists:
+        return inds, dists
+
+    return inds
 
 
 def get_value_by_time(timestamps, values, timepoint, time_threshold=None, axis=None):
@@ -398,21 +476,34 @@ def get_values_by_times(timestamps, values, timepoints, time_threshold=None,
     """
 
     axis = check_axis(axis, values)
-    inds = get_inds_by_times(timestamps, timepoints, time_threshold, drop_null)
+    inds = get_inds_by_times(timestamps, timepoints, time_threshold, drop_null=False)
+
+    mask = inds >= 0
+    selected = values.take(indices=inds[mask], axis=axis)
 
     if drop_null:
-        outputs = values.take(indices=inds, axis=check_axis(axis, values))
+        outputs = selected
     else:
-        outputs = np.full([np.atleast_2d(values).shape[0], len(timepoints)], np.nan)
-        mask = inds >= 0
-        outputs[:, np.where(mask)[0]] = values.take(indices=inds[mask], axis=axis)
-        # Squeeze, with a special check for single value shape with needs an axis setting
-        outputs = np.squeeze(outputs, axis=0 if outputs.shape == (1, 1) else None)
+        # Create an output array with the same shape as values, except along the time axis,
+        #   filling in selected values, and with NaN where there is no selected value
+        shape = list(values.shape)
+        shape[axis] = len(timepoints)
+        dtype = values.dtype if np.issubdtype(values.dtype, np.floating) else float
+        outputs = np.empty(shape, dtype=dtype)
+
+        index = [slice(None)] * values.ndim
+        index[axis] = mask
+        outputs[tuple(index)] = selected
+        index[axis] = ~mask
+        outputs[tuple(index)] = np.nan
+
+        # Squeeze singleton dimensions, keeping at least 1d for a single selected value
+        outputs = np.atleast_1d(np.squeeze(outputs))
 
     return outputs
 
 
-def get_values_by_time_range(timestamps, values, t_min, t_max, axis=None):
+def get_values_by_time_range(timestamps, values, t_min, t_max, axis=None, assume_sorted=False):
     """Extract data for a requested time range.
 
     Parameters
@@ -426,6 +517,9 @@ def get_values_by_time_range(timestamps, values, t_min, t_max, axis=None):
     axis : {0, 1}, optional
         The axis argument for the `values` data, if it's a 2d array, as {0: column, 1: row}.
         If not provided, is inferred from the `values` array.
+    assume_sorted : bool, optional, default: False
+        Whether to assume that `timestamps` is sorted (monotonically increasing).
+        If True, the time range is found with a binary search, rather than by masking.
 
     Returns
     -------
@@ -444,10 +538,17 @@ def get_values_by_time_range(timestamps, values, t_min, t_max, axis=None):
     (array([2, 3, 4, 5, 6]), array([1. , 1.5, 2. , 2.5, 3. ]))
     """
 
-    select = np.logical_and(timestamps >= t_min, timestamps <= t_max)
-    out = values.take(indices=np.where(select)[0], axis=check_axis(axis, values))
+    if assume_sorted:
+        # Find the range of indices within the time range - with both t_min & t_max being inclusive
+        start = np.searchsorted(timestamps, t_min, side='left')
+        stop = np.searchsorted(timestamps, t_max, side='right')
+        inds = np.arange(start, max(start, stop))
+    else:
+        inds = np.where(np.logical_and(timestamps >= t_min, timestamps <= t_max))[0]
 
-    return timestamps[select], out
+    out = values.take(indices=inds, axis=check_axis(axis, values))
+
+    return timestamps[inds], out
 
 
 def threshold_spikes_by_times(spikes, timestamps, time_threshold):
@@ -468,6 +569,10 @@ def threshold_spikes_by_times(spikes, timestamps, time_threshold):
     spikes : 1d array
         Sub-selected spike times, in seconds.
 
+    Notes
+    -----
+    This function assumes that `timestamps` is sorted (monotonically increasing).
+
     Examples
     --------
     Extract spikes based on their proximity to timestamps:
@@ -478,9 +583,8 @@ def threshold_spikes_by_times(spikes, timestamps, time_threshold):
     array([0.76, 1.12, 1.72, 2.05, 3.63, 3.91])
     """
 
-    mask = np.empty_like(spikes, dtype=bool)
-    for ind, spike in enumerate(spikes):
-        mask[ind] = np.min(np.abs(timestamps - spike)) < time_threshold
+    _, dists = _get_closest_inds(timestamps, spikes, return_dists=True)
+    mask = dists < time_threshold
 
     return spikes[mask]
 
@@ -520,11 +624,13 @@ def threshold_spikes_by_values(spikes, timestamps, values, min_value=None,
     array([1.6, 2.5])
     """
 
-    values = get_values_by_times(timestamps, values, spikes, time_threshold, drop_null=False)
+    # Get the value for each spike, and sub-select spikes with values within the requested range
+    #   Note: create_mask also excludes any spikes whose corresponding value is NaN
+    inds = get_inds_by_times(timestamps, spikes, time_threshold, drop_null=False)
+    mask = inds >= 0
+    mask[mask] = create_mask(values[inds[mask]], min_value, max_value)
 
-    spikes, values = select_from_arrays(create_nan_mask(values), spikes, values)
-
-    spikes = spikes[create_mask(values, min_value, max_value)]
+    spikes = spikes[mask]
 
     return spikes
 
@@ -561,24 +667,22 @@ def drop_range(spikes, time_range, check_empty=True):
     # Check for time range is not empty (if is empty list, do nothing)
     if time_range:
 
-        # Operate on a copy of the input, to not overwrite original array
-        spikes = spikes.copy()
-
-        total_len = 0
-        for trange in np.array(time_range, ndmin=2):
-
-            if total_len > 0:
-                trange = [trange[0] - total_len, trange[1] - total_len]
+        # Organize the time ranges, sorted by start time, and compute cumulative dropped length
+        time_ranges = np.array(time_range, ndmin=2, dtype=float)
+        time_ranges = time_ranges[np.argsort(time_ranges[:, 0])]
+        starts, ends = time_ranges[:, 0], time_ranges[:, 1]
+        cum_lens = np.concatenate([[0], np.cumsum(ends - starts)])
 
-            if check_empty:
-                assert get_range(spikes, *trange).size == 0, \
-                    "Extracted range {} is not empty.".format(trange)
+        # For each spike, find the index of the latest time range that starts before it
+        range_inds = np.searchsorted(starts, spikes, side='right') - 1
+        in_range = (range_inds >= 0) & (spikes < ends[range_inds.clip(min=0)])
 
-            tlen = trange[1] - trange[0]
-            spikes = np.hstack([get_range(spikes, max_value=trange[0]),
-                                get_range(spikes, min_value=trange[1], reset=tlen)])
+        if check_empty:
+            assert not np.any(in_range), "Extracted range {} is not empty.".format(\
+                time_ranges[range_inds[in_range][0]].tolist())
 
-            total_len += trange[1] - trange[0]
+        # Drop any spikes within the time ranges, and shift later spikes by the dropped length
+        spikes = spikes[~in_range] - cum_lens[range_inds[~in_range] + 1]
 
     return spikes
 
@@ -597,11 +701,14 @@ def _reinstate_range_1d(spikes, time_range):
     -------
     out_spikes : 1d array
         Spike times, in seconds, with the time range reinstated.
+
+    Notes
+    -----
+    This operation is applied element-wise, and so can also be applied to 2d arrays of spike times.
     """
 
-    tlen = time_range[1] - time_range[0]
-    out_spikes = np.hstack([get_range(spikes, max_value=time_range[0]),
-                            get_range(spikes, min_value=time_range[0]) + tlen])
+    out_spikes = spikes.astype(float)
+    out_spikes[out_spikes >= time_range[0]] += time_range[1] - time_range[0]
 
     return out_spikes
 
@@ -634,14 +741,10 @@ def reinstate_range(spikes, time_range):
 
     assert spikes.ndim < 3, 'The reinstate_range function only supports 1d or 2d arrays.'
 
-    # Operate on a copy of the input, to not overwrite original array
-    spikes = spikes.copy()
-
-    # By enforcing 2d (and later squeezing), the loops works for both 1d & 2d arrays
-    spikes = np.atleast_2d(spikes)
+    # Reinstating is applied element-wise, so can be applied across all rows at once
+    #   Note that this also operates on a copy of the input, to not overwrite original array
     for trange in np.array(time_range, ndmin=2):
-        for ind, spikes_1d in enumerate(spikes):
-            spikes[ind, :] = _reinstate_range_1d(spikes_1d, trange)
+        spikes = _reinstate_range_1d(spikes, trange)
 
     spikes = np.squeeze(spikes)
 
@@ -40,3 +40,43 @@ def set_random_state(seed_value=0):
     """
 
     return np.random.RandomState(seed_value)
+
+
+def check_rng(rng=None):
+    """Check a random number generator, defaulting to the global numpy random state.
+
+    Parameters
+    ----------
+    rng : np.random.Generator or np.random.RandomState or int, optional
+        Random number generator to use.
+        If int, is used as a seed to initialize a new Generator.
+        If not provided, the global numpy random state is used.
+
+    Returns
+    -------
+    rng : np.random.Generator or np.random.RandomState or module
+        Random number generator, with methods for drawing samples (such as `random`).
+
+    Raises
+    ------
+    TypeError
+        If `rng` is not None, an int, a Generator or a RandomState.
+
+    Notes
+    -----
+    Using the global numpy random state as the default means that `set_random_seed` continues
+    to control any functions that use this check, if no generator is provided.
+    Independent generators, for example for parallel simulations, can be created with
+    `np.random.default_rng(seed).spawn(n_children)`.
+    """
+
+    if rng is None:
+        rng = np.random
+    elif isinstance(rng, (int, np.integer)):
+        rng = np.random.default_rng(rng)
+    elif not isinstance(rng, (np.random.Generator, np.random.RandomState)):
+        msg = ("The rng should be None, an int, or a numpy Generator or RandomState, "
+               "but got type: {}.".format(type(rng).__name__))
+        raise TypeError(msg)
+
+    return rng